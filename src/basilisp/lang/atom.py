@@ -12,7 +12,7 @@ P = ParamSpec("P")
 
 
 class Atom(RefBase[T], Generic[T]):
-    __slots__ = ("_meta", "_state", "_lock", "_watches", "_validator")
+    __slots__ = ("_meta", "_state", "_lock", "_watches", "_validator", "__weakref__")
 
     def __init__(
         self,
@@ -375,11 +375,14 @@ def map(  # pylint:disable=redefined-builtin
     kvs: Mapping[K, V], meta: Optional[IPersistentMap] = None
 ) -> PersistentMap[K, V]:
     """Creates a new map."""
-    # For some reason, creating a new `immutables.Map` instance from an existing
-    # `basilisp.lang.map.PersistentMap` instance causes issues because the `__iter__`
-    # returns only the keys rather than tuple of key/value pairs, even though it
-    # adheres to the `Mapping` protocol. Passing the `.items()` directly bypasses
-    # this problem.
+    # Existing maps are immutable, so the new map can share the underlying
+    # `immutables.Map` rather than rebuilding it entry by entry.
+    if isinstance(kvs, PersistentMap):
+        return PersistentMap(kvs._inner, meta=meta)
+    # `immutables.Map` treats any argument other than a `dict` or one of its own
+    # maps as an iterable of key/value pairs, but iterating over other `Mapping`
+    # types yields only their keys. Passing the `.items()` directly bypasses this
+    # problem.
     return PersistentMap.from_coll(kvs.items(), meta=meta)
 
 
@@ -86,6 +86,8 @@ READER_END_COL_KW = kw.keyword("end-col", ns="basilisp.lang.reader")
 READER_COND_FORM_KW = kw.keyword("form")
 READER_COND_SPLICING_KW = kw.keyword("splicing?")
 
+_TAG_META_KEY = kw.keyword("tag")
+
 _AMPERSAND = sym.symbol("&")
 _FN = sym.symbol("fn*")
 _INTEROP_CALL = sym.symbol(".")
@@ -1077,7 +1079,7 @@ def _read_meta(ctx: ReaderContext) -> IMeta:
 
     meta_map: Optional[lmap.PersistentMap[LispForm, LispForm]]
     if isinstance(meta, sym.Symbol):
-        meta_map = lmap.map({kw.keyword("tag"): meta})
+        meta_map = lmap.map({_TAG_META_KEY: meta})
     elif isinstance(meta, kw.Keyword):
         meta_map = lmap.map({meta: True})
     elif isinstance(meta, lmap.PersistentMap):
@@ -25,7 +25,10 @@ class ReferenceBase(IReference):
     `basilisp.lang.runtime.Namespace` objects are the only objects which are
     `IReference` objects without also being `IRef` objects.
 
-    Implementers must have the `_lock` and `_meta` properties defined."""
+    Implementers must have the `_lock` and `_meta` properties defined. They should
+    be declared in the implementer's `__slots__`, since this mixin declares none."""
+
+    __slots__ = ()
 
     _lock: threading.RLock
     _meta: Optional[IPersistentMap]
@@ -37,12 +40,12 @@ class ReferenceBase(IReference):
 
     def alter_meta(self, f: AlterMeta, *args) -> Optional[IPersistentMap]:
         with self._lock:
-            self._meta = f(self._meta, *args)
+            self._meta = f(self._meta, *args)  # type: ignore[misc]
             return self._meta
 
     def reset_meta(self, meta: Optional[IPersistentMap]) -> Optional[IPersistentMap]:
         with self._lock:
-            self._meta = meta
+            self._meta = meta  # type: ignore[misc]
             return meta
 
 
@@ -59,12 +62,14 @@ class RefBase(IRef[T], ReferenceBase):
     Implementers must have the `_validators` and `_watches` properties defined.
     """
 
+    __slots__ = ()
+
     _validator: Optional[RefValidator[T]]
     _watches: IPersistentMap[RefWatchKey, RefWatcher[T]]
 
     def add_watch(self, k: RefWatchKey, wf: RefWatcher[T]) -> "RefBase[T]":
         with self._lock:
-            self._watches = self._watches.assoc(k, wf)
+            self._watches = self._watches.assoc(k, wf)  # type: ignore[misc]
             return self
 
     def _notify_watches(self, old: T, new: T) -> None:
@@ -73,7 +78,7 @@ class RefBase(IRef[T], ReferenceBase):
 
     def remove_watch(self, k: RefWatchKey) -> "RefBase[T]":
         with self._lock:
-            self._watches = self._watches.dissoc(k)
+            self._watches = self._watches.dissoc(k)  # type: ignore[misc]
             return self
 
     def get_validator(self) -> Optional[RefValidator[T]]:
@@ -83,7 +88,7 @@ class RefBase(IRef[T], ReferenceBase):
         with self._lock:
             if vf is not None:
                 self._validate(self.deref(), vf=vf)
-            self._validator = vf
+            self._validator = vf  # type: ignore[misc]
 
     def _validate(self, val: Any, vf: Optional[RefValidator[T]] = None) -> None:
         vf = vf or self._validator
@@ -1,4 +1,5 @@
 # pylint: disable=too-many-lines
+import bisect
 import builtins
 import collections.abc
 import contextlib
@@ -16,6 +17,7 @@ import re
 import sys
 import threading
 import types
+import weakref
 from collections.abc import Iterable, Iterator, Mapping, Sequence, Sized
 from fractions import Fraction
 from typing import AbstractSet, Any, Callable, NoReturn, Optional, TypeVar, Union, cast
@@ -28,7 +30,6 @@ from basilisp.lang import seq as lseq
 from basilisp.lang import set as lset
 from basilisp.lang import symbol as sym
 from basilisp.lang import vector as vec
-from basilisp.lang.atom import Atom
 from basilisp.lang.interfaces import (
     IAssociative,
     IBlockingDeref,
@@ -49,7 +50,7 @@ from basilisp.lang.interfaces import (
     ReduceFunction,
 )
 from basilisp.lang.reduced import Reduced
-from basilisp.lang.reference import RefBase, ReferenceBase
+from basilisp.lang.reference import AlterMeta, RefBase, ReferenceBase
 from basilisp.lang.typing import BasilispFunction, CompilerOpts, LispNumber
 from basilisp.lang.util import OBJECT_DUNDER_METHODS, demunge, is_abstract, munge
 from basilisp.util import Maybe
@@ -91,6 +92,10 @@ _DYNAMIC_META_KEY = kw.keyword("dynamic")
 _PRIVATE_META_KEY = kw.keyword("private")
 _REDEF_META_KEY = kw.keyword("redef")
 
+_PRIVATE_META = lmap.map({_PRIVATE_META_KEY: True})
+
+_NS_VAR_NAME_SYM = sym.symbol(NS_VAR_NAME)
+
 # Special form values, used for resolving Vars
 _AWAIT = sym.symbol("await")
 _CATCH = sym.symbol("catch")
@@ -221,6 +226,11 @@ class Unbound:
         return self is other or (isinstance(other, Unbound) and self.var == other.var)
 
 
+def _is_private_meta(meta: Optional[IPersistentMap]) -> bool:
+    """Return True if the metadata map `meta` marks its owner as private."""
+    return meta is not None and bool(meta.val_at(_PRIVATE_META_KEY))
+
+
 class Var(RefBase):
     __slots__ = (
         "_name",
@@ -230,9 +240,11 @@ class Var(RefBase):
         "_is_bound",
         "_tl",
         "_meta",
+        "_private",
         "_lock",
         "_watches",
         "_validator",
+        "__weakref__",
     )
 
     def __init__(
@@ -264,6 +276,8 @@ class Var(RefBase):
             else:
                 self._meta = lmap.map({_DYNAMIC_META_KEY: True})
 
+        self._private = _is_private_meta(self._meta)
+
     def __repr__(self):
         return f"#'{self.ns.name}/{self.name}"
 
@@ -291,10 +305,20 @@ class Var(RefBase):
             self._tl = _VarBindings() if dynamic else None
 
     @property
-    def is_private(self) -> Optional[bool]:
-        if self._meta is not None:
-            return self._meta.val_at(_PRIVATE_META_KEY)
-        return False
+    def is_private(self) -> bool:
+        return self._private
+
+    def alter_meta(self, f: AlterMeta, *args) -> Optional[IPersistentMap]:
+        with self._lock:
+            meta = super().alter_meta(f, *args)
+            self._private = _is_private_meta(meta)
+            return meta
+
+    def reset_meta(self, meta: Optional[IPersistentMap]) -> Optional[IPersistentMap]:
+        with self._lock:
+            super().reset_meta(meta)
+            self._private = _is_private_meta(meta)
+            return meta
 
     @property
     def is_bound(self) -> bool:
@@ -478,10 +502,39 @@ class _ThreadBindings(threading.local):
 _THREAD_BINDINGS = _ThreadBindings()
 
 
+class _CompletionIndex:
+    """Sorted index of the Symbol keys of a persistent map by name.
+
+    Persistent maps are immutable, so an index remains valid for as long as its
+    source is the map currently held by the owner. The index holds only a weak
+    reference to its source and the source's keys, so it never keeps the values of
+    a replaced map alive."""
+
+    __slots__ = ("_source", "_names", "_syms")
+
+    def __init__(self, source: lmap.PersistentMap) -> None:
+        self._source = weakref.ref(source)
+        self._syms: list[sym.Symbol] = sorted(source.keys(), key=lambda s: s.name)
+        self._names = [s.name for s in self._syms]
+
+    def is_index_of(self, m: lmap.PersistentMap) -> bool:
+        """Return True if this index was built from the map `m`."""
+        return self._source() is m
+
+    def matches(self, prefix: str) -> Iterator[sym.Symbol]:
+        """Return an iterator of Symbols whose names begin with `prefix`."""
+        names, syms = self._names, self._syms
+        for i in range(bisect.bisect_left(names, prefix), len(names)):
+            if not names[i].startswith(prefix):
+                break
+            yield syms[i]
+
+
 AliasMap = lmap.PersistentMap[sym.Symbol, sym.Symbol]
 Module = Union[BasilispModule, types.ModuleType]
 ModuleMap = lmap.PersistentMap[sym.Symbol, Module]
 NamespaceMap = lmap.PersistentMap[sym.Symbol, "Namespace"]
+NamespaceCache = dict[sym.Symbol, "Namespace"]
 VarMap = lmap.PersistentMap[sym.Symbol, Var]
 
 
@@ -522,7 +575,7 @@ class Namespace(ReferenceBase):
     # If this set is updated, be sure to update the following two locations:
     # - basilisp.lang.compiler.generator._MODULE_ALIASES
     # - the `namespace_imports` section in the documentation
-    DEFAULT_IMPORTS = lset.set(
+    DEFAULT_IMPORTS = frozenset(
         map(
             sym.symbol,
             [
@@ -558,7 +611,14 @@ class Namespace(ReferenceBase):
         )
     )
 
-    _NAMESPACES: Atom[NamespaceMap] = Atom(lmap.PersistentMap.empty())
+    # Resolved modules for `DEFAULT_IMPORTS`, populated when the first Namespace
+    # is created and shared by every Namespace created afterwards.
+    _DEFAULT_IMPORTS_MAP: Optional[ModuleMap] = None
+
+    # The global Namespace cache is read far more often than it is written, so
+    # reads go directly to the dict and only writers take the lock.
+    _NAMESPACES: NamespaceCache = {}
+    _NAMESPACES_LOCK = threading.RLock()
 
     __slots__ = (
         "_name",
@@ -570,6 +630,8 @@ class Namespace(ReferenceBase):
         "_aliases",
         "_imports",
         "_import_aliases",
+        "_completion_indices",
+        "__weakref__",
     )
 
     def __init__(
@@ -582,18 +644,26 @@ class Namespace(ReferenceBase):
         self._lock = threading.RLock()
 
         self._aliases: NamespaceMap = lmap.PersistentMap.empty()
-        self._imports: ModuleMap = lmap.map(
-            dict(
-                map(
-                    lambda s: (s, importlib.import_module(s.name)),
-                    Namespace.DEFAULT_IMPORTS,
-                )
-            )
-        )
+        self._imports: ModuleMap = Namespace.__default_imports()
         self._import_aliases: AliasMap = lmap.PersistentMap.empty()
         self._interns: VarMap = lmap.PersistentMap.empty()
         self._refers: VarMap = lmap.PersistentMap.empty()
 
+        self._completion_indices: dict[str, _CompletionIndex] = {}
+
+    @classmethod
+    def __default_imports(cls) -> ModuleMap:
+        """Return a map of the modules named in `DEFAULT_IMPORTS`.
+
+        The default imports cannot be resolved when this module is loaded since some
+        of them import this module, so they are resolved once on first use."""
+        m = cls._DEFAULT_IMPORTS_MAP
+        if m is None:
+            m = cls._DEFAULT_IMPORTS_MAP = lmap.PersistentMap.from_coll(
+                (s, importlib.import_module(s.name)) for s in cls.DEFAULT_IMPORTS
+            )
+        return m
+
     @property
     def name(self) -> str:
         return self._name.name
@@ -753,11 +823,12 @@ class Namespace(ReferenceBase):
     def find(self, sym: sym.Symbol) -> Optional[Var]:
         """Find Vars mapped by the given Symbol input or None if no Vars are
         mapped by that Symbol."""
-        with self._lock:
-            v = self._interns.val_at(sym, None)
-            if v is None:
-                return self._refers.val_at(sym, None)
-            return v
+        # Intern and refer maps are immutable and only ever replaced wholesale,
+        # so they can be read here without acquiring the Namespace lock.
+        v = self._interns.val_at(sym, None)
+        if v is None:
+            return self._refers.val_at(sym, None)
+        return v
 
     def add_import(self, sym: sym.Symbol, module: Module, *aliases: sym.Symbol) -> None:
         """Add the Symbol as an imported Symbol in this Namespace. If aliases are given,
@@ -798,38 +869,17 @@ class Namespace(ReferenceBase):
 
     def refer_all(self, other_ns: "Namespace") -> None:
         """Refer all the Vars in the other namespace."""
+        public_vars = {
+            s: var for s, var in other_ns.interns.items() if not var.is_private
+        }
         with self._lock:
-            final_refers = self._refers
-            for s, var in other_ns.interns.items():
-                if not var.is_private:
-                    final_refers = final_refers.assoc(s, var)
-            self._refers = final_refers
+            self._refers = self._refers.update(public_vars)
 
     @classmethod
     def ns_cache(cls) -> lmap.PersistentMap:
         """Return a snapshot of the Namespace cache."""
-        return cls._NAMESPACES.deref()
-
-    @staticmethod
-    def __get_or_create(
-        ns_cache: NamespaceMap,
-        name: sym.Symbol,
-        module: Optional[BasilispModule] = None,
-    ) -> lmap.PersistentMap:
-        """Private swap function used by `get_or_create` to atomically swap
-        the new namespace map into the global cache."""
-        ns = ns_cache.val_at(name, None)
-        if ns is not None:
-            return ns_cache
-        new_ns = Namespace(name, module=module)
-        # The `ns` macro is important for setting up an new namespace,
-        # but it becomes available only after basilisp.core has been
-        # loaded.
-        ns_var = Var.find_in_ns(CORE_NS_SYM, sym.symbol("ns"))
-        if ns_var:
-            new_ns.add_refer(sym.symbol("ns"), ns_var)
-
-        return ns_cache.assoc(name, new_ns)
+        with cls._NAMESPACES_LOCK:
+            return lmap.map(cls._NAMESPACES)
 
     @classmethod
     def get_or_create(
@@ -838,15 +888,31 @@ class Namespace(ReferenceBase):
         """Get the namespace bound to the symbol `name` in the global namespace
         cache, creating it if it does not exist.
         Return the namespace."""
-        return cls._NAMESPACES.swap(Namespace.__get_or_create, name, module=module)[
-            name
-        ]
+        ns = cls._NAMESPACES.get(name)
+        if ns is not None:
+            return ns
+
+        with cls._NAMESPACES_LOCK:
+            ns = cls._NAMESPACES.get(name)
+            if ns is not None:
+                return ns
+
+            new_ns = Namespace(name, module=module)
+            # The `ns` macro is important for setting up an new namespace,
+            # but it becomes available only after basilisp.core has been
+            # loaded.
+            ns_var = Var.find_in_ns(CORE_NS_SYM, sym.symbol("ns"))
+            if ns_var:
+                new_ns.add_refer(sym.symbol("ns"), ns_var)
+
+            cls._NAMESPACES[name] = new_ns
+            return new_ns
 
     @classmethod
     def get(cls, name: sym.Symbol) -> "Optional[Namespace]":
         """Get the namespace bound to the symbol `name` in the global namespace
         cache. Return the namespace if it exists or None otherwise.."""
-        return cls._NAMESPACES.deref().val_at(name, None)
+        return cls._NAMESPACES.get(name)
 
     @classmethod
     def remove(cls, name: sym.Symbol) -> Optional["Namespace"]:
@@ -855,26 +921,24 @@ class Namespace(ReferenceBase):
         Return None if the namespace did not exist in the cache."""
         if name == CORE_NS_SYM:
             raise ValueError("Cannot remove the Basilisp core namespace")
-        while True:
-            oldval: lmap.PersistentMap = cls._NAMESPACES.deref()
-            ns: Optional[Namespace] = oldval.val_at(name, None)
-            newval = oldval
-            if ns is not None:
-                newval = oldval.dissoc(name)
-            if cls._NAMESPACES.compare_and_set(oldval, newval):
-                return ns
+        with cls._NAMESPACES_LOCK:
+            return cls._NAMESPACES.pop(name, None)
 
     # REPL Completion support
 
-    @staticmethod
-    def __completion_matcher(text: str) -> CompletionMatcher:
-        """Return a function which matches any symbol keys from map entries
-        against the given text."""
-
-        def is_match(entry: tuple[sym.Symbol, Any]) -> bool:
-            return entry[0].name.startswith(text)
+    def __completion_candidates(
+        self, kind: str, m: lmap.PersistentMap, prefix: str
+    ) -> Iterator[tuple[sym.Symbol, Any]]:
+        """Return an iterator of entries from the map `m` whose Symbol key names
+        begin with the given prefix.
 
-        return is_match
+        Candidates are found using a sorted index of the map's keys, which is
+        cached per `kind` and rebuilt only when the map has changed since the
+        index was last built."""
+        index = self._completion_indices.get(kind)
+        if index is None or not index.is_index_of(m):
+            index = self._completion_indices[kind] = _CompletionIndex(m)
+        return ((s, m.val_at(s)) for s in index.matches(prefix))
 
     def __complete_alias(
         self, prefix: str, name_in_ns: Optional[str] = None
@@ -882,10 +946,7 @@ class Namespace(ReferenceBase):
         """Return an iterable of possible completions matching the given
         prefix from the list of aliased namespaces. If name_in_ns is given,
         further attempt to refine the list to matching names in that namespace."""
-        candidates = filter(
-            Namespace.__completion_matcher(prefix),
-            ((s, n) for s, n in self.aliases.items()),
-        )
+        candidates = self.__completion_candidates("aliases", self.aliases, prefix)
         if name_in_ns is not None:
             for _, candidate_ns in candidates:
                 for match in candidate_ns.__complete_interns(
@@ -904,17 +965,19 @@ class Namespace(ReferenceBase):
         is given, further attempt to refine the list to matching names in that
         namespace."""
         imports = self.imports
-        aliases = lmap.map(
-            {
-                alias: imports.val_at(import_name)
-                for alias, import_name in self.import_aliases.items()
-            }
+        aliases = (
+            (alias, imports.val_at(import_name))
+            for alias, import_name in self.__completion_candidates(
+                "import_aliases", self.import_aliases, prefix
+            )
         )
 
-        candidates = filter(
-            Namespace.__completion_matcher(prefix),
-            itertools.chain(
-                aliases.items(), imports.items(), [(sym.symbol("python"), builtins)]
+        candidates = itertools.chain(
+            aliases,
+            self.__completion_candidates("imports", imports, prefix),
+            filter(
+                lambda entry: entry[0].name.startswith(prefix),
+                [(sym.symbol("python"), builtins)],
             ),
         )
         if name_in_module is not None:
@@ -931,28 +994,17 @@ class Namespace(ReferenceBase):
     ) -> Iterable[str]:
         """Return an iterable of possible completions matching the given
         prefix from the list of interned Vars."""
-        if include_private_vars:
-            is_match = Namespace.__completion_matcher(value)
-        else:
-            _is_match = Namespace.__completion_matcher(value)
-
-            def is_match(entry: tuple[sym.Symbol, Var]) -> bool:
-                return _is_match(entry) and not entry[1].is_private
-
-        return map(
-            lambda entry: f"{entry[0].name}",
-            filter(is_match, ((s, v) for s, v in self.interns.items())),
-        )
+        candidates = self.__completion_candidates("interns", self.interns, value)
+        if not include_private_vars:
+            candidates = filter(lambda entry: not entry[1].is_private, candidates)
+        return map(lambda entry: f"{entry[0].name}", candidates)
 
     def __complete_refers(self, value: str) -> Iterable[str]:
         """Return an iterable of possible completions matching the given
         prefix from the list of referred Vars."""
         return map(
             lambda entry: f"{entry[0].name}",
-            filter(
-                Namespace.__completion_matcher(value),
-                ((s, v) for s, v in self.refers.items()),
-            ),
+            self.__completion_candidates("refers", self.refers, value),
         )
 
     def complete(self, text: str) -> Iterable[str]:
@@ -2288,7 +2340,7 @@ def add_generated_python(
             sym.symbol(GENERATED_PYTHON_VAR_NAME),
             "",
             dynamic=True,
-            meta=lmap.map({_PRIVATE_META_KEY: True}),
+            meta=_PRIVATE_META,
         )
     )
     # Accessing the Var root via the property uses a lock, which is the
@@ -2313,11 +2365,17 @@ def print_generated_python() -> bool:
 
 
 def init_ns_var() -> Var:
-    """Initialize the dynamic `*ns*` variable in the `basilisp.core` Namespace."""
+    """Initialize the dynamic `*ns*` variable in the `basilisp.core` Namespace.
+
+    This function is idempotent. If `*ns*` is already interned in `basilisp.core`,
+    the existing Var is returned unchanged."""
     core_ns = Namespace.get_or_create(CORE_NS_SYM)
+    if (ns_var := core_ns.find(_NS_VAR_NAME_SYM)) is not None:
+        return ns_var
+
     ns_var = Var.intern(
         core_ns,
-        sym.symbol(NS_VAR_NAME),
+        _NS_VAR_NAME_SYM,
         core_ns,
         dynamic=True,
         meta=lmap.map(
@@ -2445,14 +2503,14 @@ def bootstrap_core(compiler_opts: CompilerOpts) -> None:
         sym.symbol(PRINT_GENERATED_PY_VAR_NAME),
         False,
         dynamic=True,
-        meta=lmap.map({_PRIVATE_META_KEY: True}),
+        meta=_PRIVATE_META,
     )
     Var.intern(
         CORE_NS_SYM,
         sym.symbol(GENERATED_PYTHON_VAR_NAME),
         "",
         dynamic=True,
-        meta=lmap.map({_PRIVATE_META_KEY: True}),
+        meta=_PRIVATE_META,
     )
 
     # Dynamic Vars for controlling printing
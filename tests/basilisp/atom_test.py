@@ -1,3 +1,5 @@
+import weakref
+
 import pytest
 
 import basilisp.lang.interfaces
@@ -23,6 +25,12 @@ def test_atom_deref_interface(interface):
     assert issubclass(atom.Atom, interface)
 
 
+def test_atom_has_slot_only_layout():
+    a = atom.Atom(1)
+    assert not hasattr(a, "__dict__")
+    assert weakref.ref(a)() is a
+
+
 def test_atom():
     a = atom.Atom(vec.PersistentVector.empty())
     assert vec.PersistentVector.empty() == a.deref()
@@ -17,7 +17,7 @@ def pickle_protocol(request) -> int:
     return request.param
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def core_ns_sym() -> sym.Symbol:
     return runtime.CORE_NS_SYM
 
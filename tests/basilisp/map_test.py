@@ -168,6 +168,18 @@ def test_map_meta():
     assert lmap.map({"type": "vec"}, meta=meta).meta == meta
 
 
+def test_map_from_map():
+    meta = lmap.m(type=symbol("str"))
+    m1 = lmap.map({"a": 1, "b": 2}, meta=meta)
+    m2 = lmap.map(m1)
+    assert m1 == m2
+    assert m2.meta is None
+
+    m3 = m2.assoc("c", 3)
+    assert lmap.map({"a": 1, "b": 2}) == m1
+    assert lmap.map({"a": 1, "b": 2, "c": 3}) == m3
+
+
 def test_map_with_meta():
     m1 = lmap.m(key1="vec")
     assert m1.meta is None
@@ -1,37 +1,40 @@
-from unittest.mock import patch
+import gc
+import time
+import weakref
 
 import pytest
 
-from basilisp.lang import atom as atom
 from basilisp.lang import keyword as kw
 from basilisp.lang import map as lmap
 from basilisp.lang import runtime as runtime
 from basilisp.lang import symbol as sym
-from basilisp.lang.runtime import Namespace, NamespaceMap, Var
+from basilisp.lang.runtime import Namespace, NamespaceCache, Var
 from tests.basilisp.helpers import CompileFn, get_or_create_ns
 
+_PRIVATE = kw.keyword("private")
+
 
 @pytest.fixture
-def ns_cache(core_ns_sym: sym.Symbol, core_ns: Namespace) -> atom.Atom[NamespaceMap]:
+def ns_cache(
+    monkeypatch: pytest.MonkeyPatch, core_ns_sym: sym.Symbol, core_ns: Namespace
+) -> NamespaceCache:
     """Patch the Namespace cache with a test fixture."""
-    with patch(
-        "basilisp.lang.runtime.Namespace._NAMESPACES",
-        new=atom.Atom(lmap.map({core_ns_sym: core_ns})),
-    ) as cache:
-        yield cache
+    cache = {core_ns_sym: core_ns}
+    monkeypatch.setattr(Namespace, "_NAMESPACES", cache)
+    return cache
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def ns_sym() -> sym.Symbol:
     return sym.symbol("some.ns")
 
 
-def test_create_ns(ns_sym: sym.Symbol, ns_cache: atom.Atom[NamespaceMap]):
-    assert len(list(ns_cache.deref().keys())) == 1
+def test_create_ns(ns_sym: sym.Symbol, ns_cache: NamespaceCache):
+    assert len(ns_cache) == 1
     ns = get_or_create_ns(ns_sym)
     assert isinstance(ns, Namespace)
     assert ns.name == ns_sym.name
-    assert len(list(ns_cache.deref().keys())) == 2
+    assert len(ns_cache) == 2
     assert ns.get_refer(sym.symbol("ns"))
 
 
@@ -45,52 +48,55 @@ def test_in_ns(ns_sym: sym.Symbol):
 
 @pytest.fixture
 def ns_cache_with_existing_ns(
-    ns_sym: sym.Symbol, core_ns_sym: sym.Symbol, core_ns: Namespace
-) -> atom.Atom[NamespaceMap]:
+    monkeypatch: pytest.MonkeyPatch,
+    ns_sym: sym.Symbol,
+    core_ns_sym: sym.Symbol,
+    core_ns: Namespace,
+) -> NamespaceCache:
     """Patch the Namespace cache with a test fixture with an existing namespace."""
-    with patch(
-        "basilisp.lang.runtime.Namespace._NAMESPACES",
-        atom.Atom(lmap.map({core_ns_sym: core_ns, ns_sym: Namespace(ns_sym)})),
-    ) as cache:
-        yield cache
+    cache = {core_ns_sym: core_ns, ns_sym: Namespace(ns_sym)}
+    monkeypatch.setattr(Namespace, "_NAMESPACES", cache)
+    return cache
 
 
-def test_get_existing_ns(
-    ns_sym: sym.Symbol, ns_cache_with_existing_ns: atom.Atom[NamespaceMap]
-):
-    assert len(list(ns_cache_with_existing_ns.deref().keys())) == 2
+def test_get_existing_ns(ns_sym: sym.Symbol, ns_cache_with_existing_ns: NamespaceCache):
+    assert len(ns_cache_with_existing_ns) == 2
     ns = get_or_create_ns(ns_sym)
     assert isinstance(ns, Namespace)
     assert ns.name == ns_sym.name
-    assert len(list(ns_cache_with_existing_ns.deref().keys())) == 2
+    assert len(ns_cache_with_existing_ns) == 2
 
 
-def test_remove_ns(
-    ns_sym: sym.Symbol, ns_cache_with_existing_ns: atom.Atom[NamespaceMap]
-):
-    assert len(list(ns_cache_with_existing_ns.deref().keys())) == 2
+def test_remove_ns(ns_sym: sym.Symbol, ns_cache_with_existing_ns: NamespaceCache):
+    assert len(ns_cache_with_existing_ns) == 2
     ns = Namespace.remove(ns_sym)
     assert isinstance(ns, Namespace)
     assert ns.name == ns_sym.name
-    assert len(list(ns_cache_with_existing_ns.deref().keys())) == 1
+    assert len(ns_cache_with_existing_ns) == 1
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def other_ns_sym() -> sym.Symbol:
     return sym.symbol("some.other.ns")
 
 
 def test_remove_non_existent_ns(
-    other_ns_sym: sym.Symbol, ns_cache_with_existing_ns: patch
+    other_ns_sym: sym.Symbol, ns_cache_with_existing_ns: NamespaceCache
 ):
-    assert len(list(ns_cache_with_existing_ns.deref().keys())) == 2
+    assert len(ns_cache_with_existing_ns) == 2
     ns = Namespace.remove(other_ns_sym)
     assert ns is None
-    assert len(list(ns_cache_with_existing_ns.deref().keys())) == 2
+    assert len(ns_cache_with_existing_ns) == 2
+
+
+def test_ns_has_slot_only_layout(ns_sym: sym.Symbol):
+    ns = Namespace(ns_sym)
+    assert not hasattr(ns, "__dict__")
+    assert weakref.ref(ns)() is ns
 
 
 def test_alter_ns_meta(
-    ns_cache: atom.Atom[NamespaceMap],
+    ns_cache: NamespaceCache,
     ns_sym: sym.Symbol,
 ):
     ns = get_or_create_ns(ns_sym)
@@ -104,7 +110,7 @@ def test_alter_ns_meta(
 
 
 def test_reset_ns_meta(
-    ns_cache: atom.Atom[NamespaceMap],
+    ns_cache: NamespaceCache,
     ns_sym: sym.Symbol,
 ):
     ns = get_or_create_ns(ns_sym)
@@ -117,14 +123,13 @@ def test_reset_ns_meta(
     assert ns.meta == lmap.m(tag=kw.keyword("async"))
 
 
-def test_cannot_remove_core(ns_cache: atom.Atom[NamespaceMap]):
+def test_cannot_remove_core(ns_cache: NamespaceCache):
     with pytest.raises(ValueError):
         Namespace.remove(sym.symbol("basilisp.core"))
 
 
-def test_imports(ns_cache: atom.Atom[NamespaceMap]):
+def test_imports(ns_cache: NamespaceCache):
     ns = get_or_create_ns(sym.symbol("ns1"))
-    time = __import__("time")
     ns.add_import(sym.symbol("time"), time, sym.symbol("py-time"), sym.symbol("py-tm"))
     assert time == ns.get_import(sym.symbol("time"))
     assert time == ns.get_import(sym.symbol("py-time"))
@@ -132,7 +137,7 @@ def test_imports(ns_cache: atom.Atom[NamespaceMap]):
     assert None is ns.get_import(sym.symbol("python-time"))
 
 
-def test_intern_does_not_overwrite(ns_cache: atom.Atom[NamespaceMap]):
+def test_intern_does_not_overwrite(ns_cache: NamespaceCache):
     ns = get_or_create_ns(sym.symbol("ns1"))
     var_sym = sym.symbol("useful-value")
 
@@ -155,7 +160,7 @@ def test_intern_does_not_overwrite(ns_cache: atom.Atom[NamespaceMap]):
     assert var_val2 == ns.find(var_sym).value
 
 
-def test_unmap(ns_cache: atom.Atom[NamespaceMap]):
+def test_unmap(ns_cache: NamespaceCache):
     ns = get_or_create_ns(sym.symbol("ns1"))
     var_sym = sym.symbol("useful-value")
 
@@ -172,35 +177,46 @@ def test_unmap(ns_cache: atom.Atom[NamespaceMap]):
     assert None is ns.find(var_sym)
 
 
-def test_refer(ns_cache: atom.Atom[NamespaceMap]):
+@pytest.mark.parametrize(
+    "private,shadow_intern,expect_refer,expect_find_val",
+    [
+        # Public Vars may be referred
+        (False, False, True, "cool string"),
+        # Private Vars may not be referred
+        (True, False, False, None),
+        # Referred Vars do not shadow interned Vars with the same name
+        (False, True, True, "lame string"),
+    ],
+)
+def test_refer(
+    ns_cache: NamespaceCache,
+    private: bool,
+    shadow_intern: bool,
+    expect_refer: bool,
+    expect_find_val,
+):
     ns1 = get_or_create_ns(sym.symbol("ns1"))
-    var_sym, var_val = sym.symbol("useful-value"), "cool string"
-    var = Var(ns1, var_sym)
-    var.set_value(var_val)
+    var_sym = sym.symbol("useful-value")
+    var = Var(ns1, var_sym, meta=lmap.map({_PRIVATE: True}) if private else None)
+    var.set_value("cool string")
     ns1.intern(var_sym, var)
 
     ns2 = get_or_create_ns(sym.symbol("ns2"))
-    ns2.add_refer(var_sym, var)
-
-    assert var is ns2.get_refer(var_sym)
-    assert var_val == ns2.find(var_sym).value
-
-
-def test_cannot_refer_private(ns_cache: atom.Atom[NamespaceMap]):
-    ns1 = get_or_create_ns(sym.symbol("ns1"))
-    var_sym, var_val = sym.symbol("useful-value"), "cool string"
-    var = Var(ns1, var_sym, meta=lmap.map({kw.keyword("private"): True}))
-    var.set_value(var_val)
-    ns1.intern(var_sym, var)
+    if shadow_intern:
+        interned_var = Var(ns1, var_sym)
+        interned_var.set_value("lame string")
+        ns2.intern(var_sym, interned_var)
 
-    ns2 = get_or_create_ns(sym.symbol("ns2"))
     ns2.add_refer(var_sym, var)
 
-    assert None is ns2.get_refer(var_sym)
-    assert None is ns2.find(var_sym)
+    assert (var if expect_refer else None) is ns2.get_refer(var_sym)
+    if expect_find_val is None:
+        assert None is ns2.find(var_sym)
+    else:
+        assert expect_find_val == ns2.find(var_sym).value
 
 
-def test_refer_all(ns_cache: atom.Atom[NamespaceMap]):
+def test_refer_all(ns_cache: NamespaceCache):
     ns1 = get_or_create_ns(sym.symbol("ns1"))
 
     var_sym1, var_val1 = sym.symbol("useful-value"), "cool string"
@@ -209,7 +225,7 @@ def test_refer_all(ns_cache: atom.Atom[NamespaceMap]):
     ns1.intern(var_sym1, var1)
 
     var_sym2, var_val2 = sym.symbol("private-value"), "private string"
-    var2 = Var(ns1, var_sym2, meta=lmap.map({kw.keyword("private"): True}))
+    var2 = Var(ns1, var_sym2, meta=lmap.map({_PRIVATE: True}))
     var2.set_value(var_val2)
     ns1.intern(var_sym2, var2)
 
@@ -237,28 +253,7 @@ def test_refer_all(ns_cache: atom.Atom[NamespaceMap]):
     assert var_val4 == ns2.find(var_sym3).value
 
 
-def test_refer_does_not_shadow_intern(ns_cache: atom.Atom[NamespaceMap]):
-    ns1 = get_or_create_ns(sym.symbol("ns1"))
-    var_sym = sym.symbol("useful-value")
-
-    var_val1 = "cool string"
-    var1 = Var(ns1, var_sym)
-    var1.set_value(var_val1)
-    ns1.intern(var_sym, var1)
-
-    ns2 = get_or_create_ns(sym.symbol("ns2"))
-    var_val2 = "lame string"
-    var2 = Var(ns1, var_sym)
-    var2.set_value(var_val2)
-    ns2.intern(var_sym, var2)
-
-    ns2.add_refer(var_sym, var1)
-
-    assert var1 is ns2.get_refer(var_sym)
-    assert var_val2 == ns2.find(var_sym).value
-
-
-def test_alias(ns_cache: atom.Atom[NamespaceMap]):
+def test_alias(ns_cache: NamespaceCache):
     ns1 = get_or_create_ns(sym.symbol("ns1"))
     ns2 = get_or_create_ns(sym.symbol("ns2"))
 
@@ -273,11 +268,11 @@ def test_alias(ns_cache: atom.Atom[NamespaceMap]):
 
 
 class TestRequireAsAlias:
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def test_ns(self) -> str:
         return "basilisp.require-as-alias-test"
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def compiler_file_path(self) -> str:
         return "require_as_alias_test"
 
@@ -311,9 +306,7 @@ class TestCompletion:
         chars_sym = sym.symbol("chars")
         str_ns = Namespace(str_ns_alias)
         str_ns.intern(join_sym, Var(ns, join_sym))
-        str_ns.intern(
-            chars_sym, Var(ns, chars_sym, meta=lmap.map({kw.keyword("private"): True}))
-        )
+        str_ns.intern(chars_sym, Var(ns, chars_sym, meta=lmap.map({_PRIVATE: True})))
         ns.add_alias(str_ns, str_ns_alias)
 
         str_alias = sym.symbol("str")
@@ -327,7 +320,7 @@ class TestCompletion:
 
         time_sym = sym.symbol("time")
         time_alias = sym.symbol("py-time")
-        ns.add_import(time_sym, __import__("time"), time_alias)
+        ns.add_import(time_sym, time, time_alias)
 
         core_ns = Namespace(sym.symbol("basilisp.core"))
         map_alias = sym.symbol("map")
@@ -347,3 +340,23 @@ class TestCompletion:
         assert {"time/asctime"} == set(ns.complete("time/as"))
         assert {"py-time/"} == set(ns.complete("py-t"))
         assert {"py-time/asctime"} == set(ns.complete("py-time/as"))
+
+    def test_completion_tracks_namespace_changes(self, ns: Namespace):
+        assert {"str/", "string?", "str"} == set(ns.complete("st"))
+
+        strip_sym = sym.symbol("strip")
+        ns.intern(strip_sym, Var(ns, strip_sym))
+        assert {"str/", "string?", "str", "strip"} == set(ns.complete("st"))
+
+        ns.unmap(sym.symbol("string?"))
+        ns.remove_alias(sym.symbol("str"))
+        assert {"str", "strip"} == set(ns.complete("st"))
+
+    def test_completion_does_not_retain_unmapped_vars(self, ns: Namespace):
+        strip_sym = sym.symbol("strip")
+        var_ref = weakref.ref(ns.intern(strip_sym, Var(ns, strip_sym)))
+        assert "strip" in set(ns.complete("st"))
+
+        ns.unmap(strip_sym)
+        gc.collect()
+        assert var_ref() is None
@@ -612,6 +612,13 @@ def test_pop_thread_bindings():
         runtime.pop_thread_bindings()
 
 
+def test_init_ns_var_is_idempotent():
+    ns_var = runtime.init_ns_var()
+    assert ns_var is runtime.init_ns_var()
+    assert ns_var is runtime.Var.find(runtime.NS_VAR_SYM)
+    assert ns_var.dynamic
+
+
 class TestToPython:
     def test_literal_to_py(self):
         assert None is runtime.to_py(None)
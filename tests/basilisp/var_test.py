@@ -1,8 +1,7 @@
-from unittest.mock import patch
+import weakref
 
 import pytest
 
-from basilisp.lang import atom as atom
 from basilisp.lang import keyword as kw
 from basilisp.lang import map as lmap
 from basilisp.lang import symbol as sym
@@ -10,7 +9,7 @@ from basilisp.lang import vector as vec
 from basilisp.lang.exception import ExceptionInfo
 from basilisp.lang.runtime import (
     Namespace,
-    NamespaceMap,
+    NamespaceCache,
     RuntimeException,
     Unbound,
     Var,
@@ -35,12 +34,16 @@ def intern_val():
 
 
 @pytest.fixture(autouse=True)
-def ns_cache(ns_sym: sym.Symbol) -> atom.Atom[NamespaceMap]:
-    with patch(
-        "basilisp.lang.runtime.Namespace._NAMESPACES",
-        atom.Atom(lmap.map({ns_sym: Namespace(ns_sym)})),
-    ) as ns_cache:
-        yield ns_cache
+def ns_cache(monkeypatch: pytest.MonkeyPatch, ns_sym: sym.Symbol) -> NamespaceCache:
+    ns_cache = {ns_sym: Namespace(ns_sym)}
+    monkeypatch.setattr(Namespace, "_NAMESPACES", ns_cache)
+    return ns_cache
+
+
+def test_var_has_slot_only_layout(ns_sym: sym.Symbol, var_name: sym.Symbol):
+    v = Var(get_or_create_ns(ns_sym), var_name)
+    assert not hasattr(v, "__dict__")
+    assert weakref.ref(v)() is v
 
 
 def test_public_var(
@@ -63,6 +66,27 @@ def test_private_var(
     assert v.is_private
 
 
+def test_var_privacy_follows_meta(
+    ns_sym: sym.Symbol,
+    var_name: sym.Symbol,
+    intern_val,
+):
+    v = Var.intern(ns_sym, var_name, intern_val)
+    assert not v.is_private
+
+    v.alter_meta(assoc, kw.keyword("private"), True)
+    assert v.is_private
+
+    v.reset_meta(lmap.m(tag=kw.keyword("async")))
+    assert not v.is_private
+
+    v.reset_meta(lmap.map({kw.keyword("private"): True}))
+    assert v.is_private
+
+    assert v is Var.intern(ns_sym, var_name, intern_val)
+    assert not v.is_private
+
+
 def test_alter_var_meta(
     ns_sym: sym.Symbol,
     var_name: sym.Symbol,